@@ -1,9 +1,15 @@
+import logging
 import os
 import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
+
 import requests
 import speech_recognition as sr
-import pyaudio
+
+# Never print() from the audio threads; the app routes these records through
+# a QueueListener so stdout I/O happens elsewhere.
+logger = logging.getLogger(__name__)
 
 
 class Listener:
@@ -25,15 +31,20 @@ class Listener:
 
         self.record_timeout = record_timeout
         self.device_index = device_index
+        self._mic_index = None
 
         self._result = ""
         self._listening = False
         self._timed_out = False
 
         self._lock = threading.Lock()
+        self._mic_lock = threading.RLock()
+        self._mic = None
         self._done_event = threading.Event()
         self._stop_event = threading.Event()
         self._thread = None
+        self._generation = 0
+        self._transcriber = ThreadPoolExecutor(max_workers=1)
 
         self.stt_provider = os.environ.get("STT_PROVIDER", "google").strip().lower()
         self.whisper_base_url = os.environ.get("WHISPER_BASE_URL", "").strip().rstrip("/")
@@ -43,6 +54,8 @@ class Listener:
             if self._listening:
                 return
             self._listening = True
+            self._generation += 1
+            generation = self._generation
             self._result = ""
             self._timed_out = False
             self._done_event.clear()
@@ -60,6 +73,8 @@ class Listener:
 
         def mic_has_input_channels(idx: int) -> bool:
             try:
+                import pyaudio
+
                 pa = pyaudio.PyAudio()
                 info = pa.get_device_info_by_index(idx)
                 pa.terminate()
@@ -68,107 +83,166 @@ class Listener:
                 return False
 
         def record():
+            handed_off = False
             try:
-                print("DEBUG listener device_index =", self.device_index)
-                names = sr.Microphone.list_microphone_names()
-                print("DEBUG mic names:", names)
+                with self._mic_lock:
+                    if self._mic is None:
+                        # Reuse the mic resolved by a previous listen; every probe
+                        # below spins up a fresh PortAudio instance.
+                        idx = self._mic_index
+                        if idx is None:
+                            logger.debug("listener device_index = %s", self.device_index)
+                            names = sr.Microphone.list_microphone_names()
+                            logger.debug("mic names: %s", names)
 
-                idx = self.device_index
-                if idx is None:
-                    idx = pick_usb_index()
+                            idx = self.device_index
+                            if idx is None:
+                                idx = pick_usb_index()
 
-                if idx is None or not mic_has_input_channels(idx):
-                    print("Mic not ready. Retrying...")
-                    time.sleep(0.35)
-                    idx = pick_usb_index()
+                            if idx is None or not mic_has_input_channels(idx):
+                                logger.warning("Mic not ready. Retrying...")
+                                time.sleep(0.35)
+                                idx = pick_usb_index()
 
-                if idx is None:
-                    print("Listener error: Could not find USB mic")
-                    return
+                                if idx is None:
+                                    logger.error("Listener error: Could not find USB mic")
+                                    return
 
-                if not mic_has_input_channels(idx):
-                    print(f"Listener error: Mic index {idx} has no input channels")
-                    return
+                                if not mic_has_input_channels(idx):
+                                    logger.error("Listener error: Mic index %s has no input channels", idx)
+                                    return
 
-                mic = sr.Microphone(device_index=idx)
+                            self._mic_index = idx
 
-                try:
-                    with mic as source:
-                        try:
-                            self.recognizer.adjust_for_ambient_noise(source, duration=0.4)
-                        except Exception:
-                            pass
+                        self._open_mic(idx)
 
-                        if ready_callback:
-                            ready_callback()
+                    source = self._mic
+                    stream = source.stream.pyaudio_stream
+                    if stream.is_stopped():
+                        stream.start_stream()
 
-                        if self._stop_event.is_set():
-                            return
+                    if ready_callback:
+                        ready_callback()
 
-                        print("Listening...")
+                    if self._stop_event.is_set():
+                        return
+
+                    logger.info("Listening...")
+                    try:
                         audio = self.recognizer.listen(
                             source,
                             timeout=self.record_timeout,
                             phrase_time_limit=None,
                         )
-
-                except AttributeError as e:
-                    print("Listener mic exit bug:", e)
-                    return
+                    finally:
+                        # Pause capture between prompts so the device buffer
+                        # doesn't hand stale audio to the next listen.
+                        stream.stop_stream()
 
                 if self._stop_event.is_set():
                     return
 
-                text = ""
-
-                if self.stt_provider == "whisper":
-                    if not self.whisper_base_url:
-                        print("WHISPER_BASE_URL not set")
-                    else:
-                        try:
-                            wav_bytes = audio.get_wav_data(convert_rate=16000, convert_width=2)
-                            files = {"file": ("audio.wav", wav_bytes, "audio/wav")}
-                            r = requests.post(
-                                f"{self.whisper_base_url}/transcribe",
-                                files=files,
-                                timeout=5,
-                            )
-                            r.raise_for_status()
-                            data = r.json()
-                            text = (data.get("text") or "").strip()
-                        except Exception as e:
-                            print("Whisper STT error:", e)
-
-                else:
-                    try:
-                        text = self.recognizer.recognize_google(audio)
-                    except Exception as e:
-                        print("Recognition error:", e)
-
-                with self._lock:
-                    self._result = text
+                # Transcribe off the capture thread so the mic can re-arm
+                # while the network round-trip is still in flight.
+                future = self._transcriber.submit(self._transcribe, audio)
+                future.add_done_callback(lambda f: self._publish(generation, f))
+                handed_off = True
 
             except sr.WaitTimeoutError:
                 with self._lock:
-                    self._result = ""
-                    self._timed_out = True
+                    if generation == self._generation:
+                        self._result = ""
+                        self._timed_out = True
 
             except Exception as e:
-                print("Listener error:", e)
+                logger.error("Listener error: %s", e)
+                self._close_mic()
+                self._mic_index = None
                 with self._lock:
-                    self._result = ""
+                    if generation == self._generation:
+                        self._result = ""
 
             finally:
+                if self._stop_event.is_set():
+                    self._close_mic()
                 with self._lock:
-                    self._listening = False
-                self._done_event.set()
+                    current = generation == self._generation
+                    if current:
+                        self._listening = False
+                if current and not handed_off:
+                    self._done_event.set()
 
         self._thread = threading.Thread(target=record, daemon=True)
         self._thread.start()
 
+    def _transcribe(self, audio):
+        text = ""
+
+        if self.stt_provider == "whisper":
+            if not self.whisper_base_url:
+                logger.error("WHISPER_BASE_URL not set")
+            else:
+                try:
+                    wav_bytes = audio.get_wav_data(convert_rate=16000, convert_width=2)
+                    files = {"file": ("audio.wav", wav_bytes, "audio/wav")}
+                    r = requests.post(
+                        f"{self.whisper_base_url}/transcribe",
+                        files=files,
+                        timeout=5,
+                    )
+                    r.raise_for_status()
+                    data = r.json()
+                    text = (data.get("text") or "").strip()
+                except Exception as e:
+                    logger.warning("Whisper STT error: %s", e)
+
+        else:
+            try:
+                text = self.recognizer.recognize_google(audio)
+            except Exception as e:
+                logger.warning("Recognition error: %s", e)
+
+        return text
+
+    def _publish(self, generation, future):
+        # Drop results for a listen that was cancelled or superseded
+        with self._lock:
+            if generation != self._generation or self._stop_event.is_set():
+                return
+            try:
+                self._result = future.result()
+            except Exception as e:
+                logger.error("Listener error: %s", e)
+                self._result = ""
+        self._done_event.set()
+
+    def _open_mic(self, idx):
+        """Open the mic and calibrate once; it stays open across listens."""
+        mic = sr.Microphone(device_index=idx)
+        mic.__enter__()
+        self._mic = mic
+        try:
+            self.recognizer.adjust_for_ambient_noise(mic, duration=0.4)
+        except Exception:
+            pass
+
+    def _close_mic(self):
+        with self._mic_lock:
+            mic, self._mic = self._mic, None
+            if mic is None:
+                return
+            try:
+                mic.__exit__(None, None, None)
+            except AttributeError as e:
+                logger.warning("Listener mic exit bug: %s", e)
+
     def speech_waiting(self):
         return self._done_event.is_set()
 
+    def wait(self, timeout=None):
+        """Block until the current listen finishes; True if it has."""
+        return self._done_event.wait(timeout)
+
     def recognize(self):
         return self._result
 
@@ -181,6 +255,8 @@ class Listener:
         t = self._thread
         if t and t.is_alive():
             t.join(timeout=0.5)
+        if not (t and t.is_alive()):
+            self._close_mic()
         with self._lock:
             self._listening = False
         self._done_event.set()
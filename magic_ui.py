@@ -5,14 +5,19 @@
 
 import threading
 import sys
+import queue
+import logging
+from logging.handlers import QueueHandler, QueueListener
 import os
 import re
 import time
+import socket
 import argparse
 import math
 import json
 from enum import Enum
 from collections import deque
+from functools import lru_cache
 
 import board
 import digitalio
@@ -122,6 +127,14 @@ SYSTEM_ROLE = "You are a master AI Storyteller that can tell a story of any leng
 OLLAMA_BASE_URL = os.environ.get("OLLAMA_BASE_URL", "http://10.110.5.182:11434").rstrip("/")
 # If you set OLLAMA_MODEL, it will be used. Otherwise we auto-pick the first model from /api/tags.
 OLLAMA_MODEL = os.environ.get("OLLAMA_MODEL", "").strip()
+OLLAMA_ERROR_STORY = "Title: Error\n\nI couldn't reach the storyteller's magic brain. Please try again."
+# The auto-picked model is remembered here so later launches skip /api/tags.
+OLLAMA_MODEL_CACHE = BASE_PATH + ".ollama_model"
+
+# Pull the one field we need out of each streamed /api/chat line without
+# building the whole JSON object. Escapes are decoded by json.loads.
+OLLAMA_CONTENT_RE = re.compile(rb'"content"\s*:\s*"((?:[^"\\]|\\.)*)"')
+OLLAMA_DONE_RE = re.compile(rb'"done"\s*:\s*true')
 
 # Speech Recognition Parameters (used by your Listener)
 ENERGY_THRESHOLD = 400
@@ -133,6 +146,25 @@ if not os.path.isfile(PROMPT_FILE):
     sys.exit(1)
 
 
+# Character clean-up for model output, applied in a single str.translate pass
+_FANCY_CHARS = str.maketrans({
+    # Replace “fancy quotes”
+    "\u2018": "'",
+    "\u2019": "'",
+    "\u201C": '"',
+    "\u201D": '"',
+    # Remove BOM / zero-width chars that often show as little boxes
+    "\ufeff": None,
+    "\u200b": None,  # zero-width space
+    "\u200c": None,
+    "\u200d": None,
+    # Replace non-breaking spaces with normal spaces
+    "\u00a0": " ",
+    # If you’re seeing the replacement character, drop it
+    "\ufffd": None,
+})
+
+
 def strip_fancy_quotes(text):
     if text is None:
         return text
@@ -140,21 +172,7 @@ def strip_fancy_quotes(text):
     # Normalize line endings
     text = text.replace("\r\n", "\n").replace("\r", "\n")
 
-    # Replace “fancy quotes”
-    text = re.sub(r"[\u2018\u2019]", "'", text)
-    text = re.sub(r"[\u201C\u201D]", '"', text)
-
-    # Remove BOM / zero-width chars that often show as little boxes
-    text = text.replace("\ufeff", "")
-    text = text.replace("\u200b", "")  # zero-width space
-    text = text.replace("\u200c", "")
-    text = text.replace("\u200d", "")
-
-    # Replace non-breaking spaces with normal spaces
-    text = text.replace("\u00a0", " ")
-
-    # If you’re seeing the replacement character, drop it
-    text = text.replace("\ufffd", "")
+    text = text.translate(_FANCY_CHARS)
 
     # Clean up trailing whitespace on lines
     text = "\n".join(line.rstrip() for line in text.split("\n"))
@@ -162,18 +180,70 @@ def strip_fancy_quotes(text):
     return text
 
 
+def _new_alpha_buf(width, height):
+    """Per-pixel alpha surface without the extra convert_alpha() copy.
+
+    A 32-bit SRCALPHA surface already uses the ARGB layout convert_alpha()
+    would produce, so buffers that are only drawn into and blitted can skip it.
+    """
+    return pygame.Surface((width, height), pygame.SRCALPHA, 32)
+
+
+@lru_cache(maxsize=64)
+def render_text(font, text, color):
+    """Render and cache text that gets redrawn (titles, messages).
+
+    The returned surface is shared; callers must only blit it.
+    """
+    return font.render(text, True, color)
+
+
+@lru_cache(maxsize=4096)
+def text_width(font, text):
+    """Cached font.size() width; words repeat across paragraphs and stories."""
+    return font.size(text)[0]
+
+
+class OllamaHTTPAdapter(requests.adapters.HTTPAdapter):
+    """HTTPAdapter with Nagle disabled and TCP keep-alive on for streaming."""
+
+    socket_options = [
+        (socket.IPPROTO_TCP, socket.TCP_NODELAY, 1),
+        (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1),
+    ]
+
+    def init_poolmanager(self, *args, **kwargs):
+        kwargs["socket_options"] = self.socket_options
+        super().init_poolmanager(*args, **kwargs)
+
+
 class OllamaClient:
-    def __init__(self, base_url: str, model: str = ""):
+    def __init__(self, base_url: str, model: str = "", cache_path: str = ""):
         self.base_url = base_url.rstrip("/")
         self.model = model.strip()
+        self.cache_path = cache_path
+        self._model_from_cache = False
+
+        # One pooled keep-alive session so the tags probe and every chat
+        # stream reuse the same TCP connection to the Ollama server.
+        self._session = requests.Session()
+        adapter = OllamaHTTPAdapter(pool_connections=2, pool_maxsize=4)
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
 
     def ensure_model(self) -> str:
-        """Pick a model if none specified; uses /api/tags."""
+        """Pick a model if none specified; uses the disk cache, then /api/tags."""
         if self.model:
             return self.model
 
+        cached = self._read_cached_model()
+        if cached:
+            self.model = cached
+            self._model_from_cache = True
+            return self.model
+
         url = f"{self.base_url}/api/tags"
-        r = requests.get(url, timeout=5)
+        r = self._session.get(url, timeout=5)
         r.raise_for_status()
         data = r.json()
 
@@ -185,17 +255,47 @@ class OllamaClient:
         self.model = models[0].get("name", "").strip()
         if not self.model:
             raise RuntimeError("Could not determine a model name from /api/tags response.")
+        self._write_cached_model()
         return self.model
 
+    def _read_cached_model(self) -> str:
+        if not self.cache_path:
+            return ""
+        try:
+            with open(self.cache_path, "r") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return ""
+        if data.get("base_url") != self.base_url:
+            return ""
+        return (data.get("model") or "").strip()
+
+    def _write_cached_model(self):
+        if not self.cache_path:
+            return
+        try:
+            with open(self.cache_path, "w") as f:
+                json.dump({"base_url": self.base_url, "model": self.model}, f)
+        except OSError as e:
+            print(f"Could not cache Ollama model name: {e}")
+
+    def _forget_cached_model(self):
+        self.model = ""
+        self._model_from_cache = False
+        if self.cache_path:
+            try:
+                os.remove(self.cache_path)
+            except OSError:
+                pass
+
     def chat_stream(self, system: str, user: str):
         """
         Stream content from /api/chat.
         Returns a generator of text chunks.
         """
-        model = self.ensure_model()
         url = f"{self.base_url}/api/chat"
         payload = {
-            "model": model,
+            "model": self.ensure_model(),
             "stream": True,
             "messages": [
                 {"role": "system", "content": system},
@@ -203,24 +303,56 @@ class OllamaClient:
             ],
         }
 
-        with requests.post(url, json=payload, stream=True, timeout=120) as r:
-            r.raise_for_status()
-            for line in r.iter_lines(decode_unicode=True):
-                if not line:
-                    continue
-                try:
-                    obj = json.loads(line)
-                except json.JSONDecodeError:
-                    continue
+        r = self._session.post(url, json=payload, stream=True, timeout=120)
+        if r.status_code == 404 and self._model_from_cache:
+            # The cached model was removed from the server; pick again once
+            r.close()
+            self._forget_cached_model()
+            payload["model"] = self.ensure_model()
+            r = self._session.post(url, json=payload, stream=True, timeout=120)
 
-                # Typical streaming chunk:
-                # {"message":{"role":"assistant","content":"..."},"done":false}
-                msg = obj.get("message", {})
-                content = msg.get("content")
+        with r:
+            r.raise_for_status()
+            pending = bytearray()
+            for data in r.iter_content(chunk_size=4096):
+                pending += data
+                while True:
+                    end = pending.find(b"\n")
+                    if end < 0:
+                        break
+                    line = bytes(pending[:end])
+                    del pending[: end + 1]
+                    if not line:
+                        continue
+
+                    content, done = self._parse_stream_line(line)
+                    if content:
+                        yield content
+                    if done:
+                        return
+
+            if pending:
+                content, _ = self._parse_stream_line(bytes(pending))
                 if content:
                     yield content
-                if obj.get("done") is True:
-                    break
+
+    @staticmethod
+    def _parse_stream_line(line):
+        """Return (content, done) for one streamed NDJSON line."""
+        # Typical streaming chunk:
+        # {"message":{"role":"assistant","content":"..."},"done":false}
+        m = OLLAMA_CONTENT_RE.search(line)
+        if m is not None:
+            content = json.loads(b'"' + m.group(1) + b'"')
+            return content, OLLAMA_DONE_RE.search(line, m.end()) is not None
+
+        # Anything unexpected (errors, schema changes) takes the slow path
+        try:
+            obj = json.loads(line)
+        except json.JSONDecodeError:
+            return "", False
+        content = obj.get("message", {}).get("content") or ""
+        return content, obj.get("done") is True
 
 
 class Position(Enum):
@@ -247,8 +379,8 @@ class Button:
         return self.x <= x <= self.x + self.width and self.y <= y <= self.y + self.height
 
     def show(self):
-        self._draw_function(self.image, self.x, self.y)
         self._visible = True
+        return self._draw_function(self.image, self.x, self.y)
 
     @property
     def width(self):
@@ -262,6 +394,10 @@ class Button:
     def visible(self):
         return self._visible
 
+    @visible.setter
+    def visible(self, value):
+        self._visible = value
+
 
 class Textarea:
     def __init__(self, x, y, width, height):
@@ -275,6 +411,53 @@ class Textarea:
         return {"width": self.width, "height": self.height}
 
 
+class StoryStreamer:
+    """Split streamed story text into blank-line separated blocks.
+
+    The first block is the title, the rest are paragraphs. Each block is
+    passed to `on_block` as soon as it is complete, so layout can start
+    before the model has finished writing.
+    """
+
+    def __init__(self, on_block):
+        self._on_block = on_block
+        self._raw = ""
+        self._text = ""
+        self._started = False
+
+    def feed(self, chunk):
+        # Only clean up whole lines; strip_fancy_quotes trims line endings
+        self._raw += chunk
+        end = self._raw.rfind("\n") + 1
+        if end:
+            self._text += strip_fancy_quotes(self._raw[:end])
+            self._raw = self._raw[end:]
+            self._emit_blocks()
+
+    def close(self):
+        self._text += strip_fancy_quotes(self._raw)
+        self._raw = ""
+        self._emit_blocks()
+        if self._started:
+            self._on_block(self._text)
+        self._text = ""
+
+    def _emit_blocks(self):
+        if not self._started:
+            self._text = self._text.lstrip()
+            if not self._text:
+                return
+            self._started = True
+
+        while True:
+            end = self._text.find("\n\n")
+            if end < 0:
+                return
+            block = self._text[:end]
+            self._text = self._text[end + 2 :]
+            self._on_block(block)
+
+
 class Book:
     def __init__(self, rotation=0):
         self.paragraph_number = 0
@@ -284,8 +467,10 @@ class Book:
         self.story = 0
         self.rotation = rotation
         self.images = {}
+        self._screen_images = {}
         self.fonts = {}
         self.buttons = {}
+        self._button_blits = {}
         self.width = 0
         self.height = 0
         self.textarea = None
@@ -293,14 +478,18 @@ class Book:
         self.saved_screen = None
         self._sleeping = False
         self.sleep_check_delay = 0.1
-        self._sleep_check_thread = None
         self._sleep_request = False
         self._running = True
-        self._busy = False
+        self._idle = threading.Event()
+        self._idle.set()
         self._loading = False
-        self._closing_times = deque(maxlen=QUIT_CLOSES)
+        self._close_ts = [0.0] * QUIT_CLOSES
+        self._close_idx = 0
+        self._close_count = 0
         self._quit_taps = deque(maxlen=3)
         self.cursor = {"x": 0, "y": 0}
+        self._rot_sin = 0.0
+        self._rot_cos = 1.0
         self.listener = None
         self.backlight = SafeBacklight()
         self.pixels = None
@@ -313,10 +502,13 @@ class Book:
                 auto_write=False,
             )
         self._prompt = ""
-        self.ollama = OllamaClient(OLLAMA_BASE_URL, OLLAMA_MODEL)
+        self.ollama = OllamaClient(OLLAMA_BASE_URL, OLLAMA_MODEL, OLLAMA_MODEL_CACHE)
+        self._model_thread = None
 
-        self._load_thread = threading.Thread(target=self._handle_loading_status)
-        self._load_thread.start()
+        self._bg_cv = threading.Condition()
+        self._reed_switch = None
+        self._background_thread = threading.Thread(target=self._handle_background)
+        self._background_thread.start()
 
     def start(self):
         # Output to the LCD instead of the console
@@ -324,6 +516,11 @@ class Book:
 
         self._set_status_color(NEOPIXEL_LOADING_COLOR)
 
+        # Resolve the Ollama model while the display and images load, so the
+        # first story isn't held up behind the /api/tags probe.
+        self._model_thread = threading.Thread(target=self._prefetch_model, daemon=True)
+        self._model_thread.start()
+
         # Initialize the display
         pygame.init()
         self.screen = pygame.display.set_mode((0, 0), pygame.FULLSCREEN)
@@ -356,6 +553,12 @@ class Book:
         
         print("CANVAS:", (self.width, self.height), "rotation:", self.rotation)
 
+        # The rotation is fixed for the session; precompute the trig that
+        # _rotate_mouse_pos needs for every tap.
+        angle = math.radians(360 - self.rotation)
+        self._rot_sin = math.sin(angle)
+        self._rot_cos = math.cos(angle)
+
 
         # Preload welcome image and display it
         self._load_image("welcome", WELCOME_IMAGE)
@@ -364,7 +567,8 @@ class Book:
 
         # Load the prompt file
         with open(PROMPT_FILE, "r") as f:
-            self._prompt = f.read()
+            # STORY_WORD_LENGTH never changes; fill it in once here
+            self._prompt = f.read().replace("{STORY_WORD_LENGTH}", str(STORY_WORD_LENGTH))
 
         # Initialize the Listener (NOTE: see section 2 below if your listener currently requires OpenAI)
         #self.listener = Listener(ENERGY_THRESHOLD, RECORD_TIMEOUT, device_index=2)
@@ -434,10 +638,14 @@ class Book:
             self.height - PAGE_NAV_HEIGHT - PAGE_TOP_MARGIN - PAGE_BOTTOM_MARGIN,
         )
 
-        # Start the sleep check thread only if reed switch is enabled
+        # Start polling the reed switch only if it is enabled
         if ENABLE_REED_SWITCH:
-            self._sleep_check_thread = threading.Thread(target=self._handle_sleep)
-            self._sleep_check_thread.start()
+            reed_switch = digitalio.DigitalInOut(REED_SWITCH_PIN)
+            reed_switch.direction = digitalio.Direction.INPUT
+            reed_switch.pull = digitalio.Pull.UP
+            with self._bg_cv:
+                self._reed_switch = reed_switch
+                self._bg_cv.notify()
 
         # Force "awake" state
         self._set_status_color(NEOPIXEL_READING_COLOR)
@@ -464,51 +672,67 @@ class Book:
         return scaled.subsurface(pygame.Rect(x, y, screen_w, screen_h)).copy()
     
     def deinit(self):
-        self._running = False
-        if self._sleep_check_thread is not None:
-            self._sleep_check_thread.join()
-        self._load_thread.join()
+        with self._bg_cv:
+            self._running = False
+            self._bg_cv.notify()
+        self._background_thread.join()
+        if self.listener is not None:
+            self.listener.stop_listening()
         self.backlight.power = True
 
-    def _handle_sleep(self):
-        reed_switch = digitalio.DigitalInOut(REED_SWITCH_PIN)
-        reed_switch.direction = digitalio.Direction.INPUT
-        reed_switch.pull = digitalio.Pull.UP
+    def _handle_background(self):
+        # One thread serves both the reed switch and the loading pulse. It
+        # only wakes on a timer while one of them needs polling; otherwise it
+        # sleeps on the condition until start(), _set_status_color() or
+        # deinit() notifies it.
+        pulse = None
+        if self.pixels is not None:
+            pulse = Pulse(
+                self.pixels,
+                speed=NEOPIXEL_PULSE_SPEED,
+                color=NEOPIXEL_LOADING_COLOR,
+                period=3,
+            )
+
+        def has_work():
+            return (
+                not self._running
+                or self._reed_switch is not None
+                or (pulse is not None and self._loading)
+            )
 
         while self._running:
-            if self._sleeping and reed_switch.value:  # Book Open
-                self._wake()
-            elif not self._sleeping and not reed_switch.value:
-                self._sleep()
-            time.sleep(self.sleep_check_delay)
-
-    def _handle_loading_status(self):
-        # If NeoPixel is not usable (not root / disabled), do nothing safely
-        if self.pixels is None:
-            while self._running:
-                time.sleep(0.2)
-            return
-    
-        pulse = Pulse(
-            self.pixels,
-            speed=NEOPIXEL_PULSE_SPEED,
-            color=NEOPIXEL_LOADING_COLOR,
-            period=3,
-        )
-    
-        while self._running:
-            if self._loading:
+            reed_switch = self._reed_switch
+            if reed_switch is not None:
+                if self._sleeping and reed_switch.value:  # Book Open
+                    self._wake()
+                elif not self._sleeping and not reed_switch.value:
+                    self._sleep()
+
+            animating = pulse is not None and self._loading
+            if animating:
                 try:
                     pulse.animate()
                 except Exception:
                     pass
-                time.sleep(0.1)
-    
-        try:
-            self.pixels.fill(0)
-            self.pixels.show()
-        except Exception:
-            pass
+
+            # Pulse.animate() only writes when a frame is due, so wake at the
+            # pulse's own frame interval rather than a fixed tick.
+            with self._bg_cv:
+                if reed_switch is not None:
+                    delay = self.sleep_check_delay
+                    self._bg_cv.wait(min(delay, NEOPIXEL_PULSE_SPEED) if animating else delay)
+                elif animating:
+                    self._bg_cv.wait(NEOPIXEL_PULSE_SPEED)
+                else:
+                    self._bg_cv.wait_for(has_work)
+
+        if self.pixels is not None:
+            try:
+                self.pixels.fill(0)
+                self.pixels.show()
+            except Exception:
+                pass
             
     def _set_status_color(self, status_color):
         if status_color not in [
@@ -519,7 +743,9 @@ class Book:
         ]:
             raise ValueError(f"Invalid status color {status_color}.")
 
-        self._loading = status_color == NEOPIXEL_LOADING_COLOR
+        with self._bg_cv:
+            self._loading = status_color == NEOPIXEL_LOADING_COLOR
+            self._bg_cv.notify()
 
         if status_color != NEOPIXEL_LOADING_COLOR:
             if self.pixels is not None:
@@ -564,15 +790,16 @@ class Book:
         if not self.rotation:
             return point
     
-        angle = 360 - self.rotation
-        x, y = point  # NOTE: pygame gives (x, y)
+        # pygame gives screen (x, y); the swap plus the precomputed inverse
+        # rotation maps it back onto the portrait canvas.
+        y, x = point
     
         x -= self.width // 2
         y -= self.height // 2
     
         x, y = (
-            x * math.cos(math.radians(angle)) - y * math.sin(math.radians(angle)),
-            x * math.sin(math.radians(angle)) + y * math.cos(math.radians(angle)),
+            x * self._rot_sin + y * self._rot_cos,
+            x * self._rot_cos - y * self._rot_sin,
         )
     
         x += self.width // 2
@@ -584,11 +811,28 @@ class Book:
             image = pygame.image.load(IMAGES_PATH + filename).convert_alpha()
             image = self._scale_and_center(image)
             self.images[name] = image
+            # Full-screen images never move; rotate them for the screen once
+            self._screen_images[name] = self._prepare_for_screen(image)
         except pygame.error:
             pass
 
     def _load_button(self, name, x, y, image, action, display_surface):
         self.buttons[name] = Button(x, y, image, action, display_surface)
+        # Buttons never move, so their screen-ready blit is prepared once
+        self._button_blits[name] = self._prepare_for_screen(image, x, y)
+
+    def _show_buttons(self, names):
+        """Draw the named buttons in a single blits() pass; returns the dirty rect."""
+        blits = []
+        for name in names:
+            self.buttons[name].visible = True
+            surface, rect = self._button_blits[name]
+            if surface is not None:
+                blits.append((surface, rect))
+        rects = self.screen.blits(blits)
+        if not rects:
+            return pygame.Rect(0, 0, 0, 0)
+        return rects[0].unionall(rects[1:])
 
     def _load_font(self, name, details):
         font_path, font_size = details
@@ -598,26 +842,58 @@ class Book:
         """
         Draw `surface` at (x,y). If target_surface is provided, draw onto it.
         Otherwise draw onto the real screen and apply rotation if needed.
+        Returns the screen rect that changed, for pygame.display.update().
         """
         if target_surface is not None:
-            target_surface.blit(surface, (x, y))
-            return
+            return target_surface.blit(surface, (x, y))
     
-        frame = self._create_transparent_buffer((self.width, self.height))
-        frame.blit(surface, (x, y))
-    
-        if self.rotation:
-            frame = pygame.transform.rotate(frame, self.rotation)
+        surface, rect = self._prepare_for_screen(surface, x, y)
+        if surface is None:
+            return rect
     
         # IMPORTANT: do NOT clear the screen here.
         # The caller (, display_message, etc.) should clear/draw background first.
-        self.screen.blit(frame, (0, 0))
+        return self.screen.blit(surface, rect)
+
+    def _display_image(self, name):
+        """Draw a preloaded full-screen image using its pre-rotated copy."""
+        surface, rect = self._screen_images[name]
+        if surface is None:
+            return rect
+        return self.screen.blit(surface, rect)
+
+    def _prepare_for_screen(self, surface, x=0, y=0):
+        """Return (surface, screen rect) ready to blit; surface is None if off-canvas."""
+        # Only the part of the surface that lands on the canvas is drawn.
+        # Rotating just that patch and placing it with _screen_rect() gives the
+        # same pixels as rotating a whole canvas-sized frame, without
+        # allocating one per draw.
+        rect = pygame.Rect(x, y, *surface.get_size()).clip(
+            pygame.Rect(0, 0, self.width, self.height)
+        )
+        if not rect.width or not rect.height:
+            return None, rect
+    
+        if self.rotation:
+            patch = surface.subsurface(rect.move(-x, -y))
+            surface = pygame.transform.rotate(patch, self.rotation)
+            return surface, self._screen_rect(rect)
+        return surface, pygame.Rect(x, y, *surface.get_size())
         
+    def _screen_rect(self, rect):
+        """Map a rect on the (unrotated) canvas to where it lands on screen."""
+        rect = pygame.Rect(rect)
+        if self.rotation == 90:
+            return pygame.Rect(rect.y, self.width - rect.right, rect.height, rect.width)
+        if self.rotation == 270:
+            return pygame.Rect(self.height - rect.bottom, rect.x, rect.height, rect.width)
+        return rect
+
     def _fade_in_surface(self, surface, x, y, fade_time, fade_steps=50):
-        # Simplified: no fade animation, just draw immediately
-        self._display_surface(self.images["background"], 0, 0)
-        self._display_surface(surface, x, y)
-        pygame.display.update()
+        # Simplified: no fade animation, just draw immediately.
+        # Draw over what is already on screen and only push the surface's
+        # own rect to the display instead of repainting the background.
+        pygame.display.update(self._display_surface(surface, x, y))
     
     def display_current_page(self):
         self._busy = True
@@ -637,9 +913,8 @@ class Book:
         self.screen.fill((255, 255, 255))
     
         # Background (only if loaded)
-        bg = self.images.get("background")
-        if bg is not None:
-            self._display_surface(bg, 0, 0)
+        if "background" in self._screen_images:
+            self._display_image("background")
     
         print(f"Loading page {self.page} of {len(self.pages)}")
         page_data = self.pages[self.page]
@@ -652,7 +927,7 @@ class Book:
                 line = line.strip()
                 if not line:
                     continue
-                surf = self.fonts["title"].render(line, True, TITLE_COLOR)
+                surf = render_text(self.fonts["title"], line, TITLE_COLOR)
                 x = self.textarea.x + (self.textarea.width - surf.get_width()) // 2
                 self.screen.blit(surf, (x, y))
                 y += self.fonts["title"].get_linesize()
@@ -664,10 +939,10 @@ class Book:
         )
     
         # Buttons
+        buttons = ["next", "new"]
         if self.page > 0 or self.story > 0:
-            self.buttons["back"].show()
-        self.buttons["next"].show()
-        self.buttons["new"].show()
+            buttons.insert(0, "back")
+        self._show_buttons(buttons)
     
         pygame.display.update()
         self._busy = False
@@ -693,10 +968,11 @@ class Book:
             words = line.split(" ")
             self.cursor["x"] = self.textarea.width // 2 - self.fonts["title"].size(line)[0] // 2
             for word in words:
-                txt = self.fonts["title"].render(word + " ", True, TITLE_COLOR)
+                txt = render_text(self.fonts["title"], word + " ", TITLE_COLOR)
                 if self._sleep_request:
                     delay_value = 0
-                    self._display_surface(txt, self.cursor["x"] + self.textarea.x, self.cursor["y"] + self.textarea.y)
+                    rect = self._display_surface(txt, self.cursor["x"] + self.textarea.x, self.cursor["y"] + self.textarea.y)
+                    pygame.display.update(rect)
                 else:
                     self._fade_in_surface(
                         txt,
@@ -705,7 +981,6 @@ class Book:
                         TITLE_FADE_TIME,
                         TITLE_FADE_STEPS,
                     )
-                pygame.display.update()
                 self.cursor["x"] += txt.get_width()
                 time.sleep(delay_value)
             self.cursor["y"] += self.fonts["title"].size(line)[1]
@@ -719,14 +994,21 @@ class Book:
 
     @staticmethod
     def _wrap_text(text, font, width):
+        # Sum cached word widths instead of re-measuring the whole growing
+        # line for every word.
+        space_w = text_width(font, " ")
         lines = []
         line = ""
+        line_w = 0
         for word in text.split(" "):
-            if font.size(line + word)[0] < width:
+            word_w = text_width(font, word)
+            if line_w + word_w < width:
                 line += word + " "
+                line_w += word_w + space_w
             else:
                 lines.append(line)
                 line = word + " "
+                line_w = word_w + space_w
         lines.append(line)
         return lines
 
@@ -765,12 +1047,12 @@ class Book:
         self.display_current_page()
 
     def display_loading(self):
-        self._display_surface(self.images["loading"], 0, 0)
+        self._display_image("loading")
         pygame.display.update()
         self._set_status_color(NEOPIXEL_LOADING_COLOR)
 
     def display_welcome(self):
-        self._display_surface(self.images["welcome"], 0, 0)
+        self._display_image("welcome")
         pygame.display.update()
 
     def display_message(self, message):
@@ -778,8 +1060,7 @@ class Book:
     
         # Background
         self.screen.fill((255, 255, 255))
-        self._display_surface(self.images["background"], 0, 0)
-        pygame.display.update()
+        self._display_image("background")
     
         screen_w, screen_h = self.screen.get_size()
         font = self.fonts["title"]
@@ -796,7 +1077,7 @@ class Book:
     
         for line in lines:
             line = line.strip()
-            surf = font.render(line, True, TITLE_COLOR)
+            surf = render_text(font, line, TITLE_COLOR)
             x = (screen_w - surf.get_width()) // 2
             self.screen.blit(surf, (x, y))
             y += line_h
@@ -805,47 +1086,66 @@ class Book:
         self._busy = False
 
     def load_story(self, story):
-        self._busy = True
-        self.pages = []
-        # --- Normalize model formatting (handles "## Title:" etc.) ---
-        story = (story or "").lstrip()
-        story = re.sub(r"^#+\s*", "", story)  # strip leading markdown heading hashes
-        story = re.sub(r"^Title\s*:\s*", "Title: ", story, flags=re.IGNORECASE)
-        
-        if not story or not story.startswith("Title: "):
+        # Stories are laid out once; flipping back to one reuses its pages
+        if story["pages"] is None:
+            self._busy = True
+            story["pages"] = self._layout_story(story["text"])
+            self._busy = False
+        self.pages = story["pages"]
+
+    def _layout_story(self, text):
+        pages = []
+        streamer = StoryStreamer(lambda block: self._layout_block(pages, block))
+        streamer.feed(text or "")
+        streamer.close()
+        self._finish_layout(pages)
+        return pages
+
+    def _layout_block(self, pages, block):
+        """Lay out the title block or the next paragraph onto `pages`."""
+        if not pages:
+            # --- Normalize model formatting (handles "## Title:" etc.) ---
+            block = re.sub(r"^#+\s*", "", block)  # strip leading markdown heading hashes
+            block = re.sub(r"^Title\s*:\s*", "Title: ", block, flags=re.IGNORECASE)
+
+            if not block.startswith("Title: "):
+                print("Unexpected story format from model. Missing Title.")
+                title = "A Story"
+            else:
+                title = block.split("Title: ")[1]
+            self._add_page(pages, title)
+            return
+
+        page = pages[-1]
+        lines = self._wrap_text(block, self.fonts["text"], self.textarea.width)
+        for line in lines:
+            self.cursor["x"] = 0
+            text = self.fonts["text"].render(line, True, TEXT_COLOR)
+            if self.cursor["y"] + self.fonts["text"].get_height() > page["buffer"].get_height():
+                page = self._add_page(pages)
+
+            self._display_surface(text, self.cursor["x"], self.cursor["y"], page["buffer"])
+            self.cursor["y"] += self.fonts["text"].size(line)[1]
+
+        if self.cursor["y"] > 0:
+            self.cursor["y"] += PARAGRAPH_SPACING
+
+    def _finish_layout(self, pages):
+        if not pages:
             print("Unexpected story format from model. Missing Title.")
-            title = "A Story"
-        else:
-            title = story.split("Title: ")[1].split("\n\n")[0]
-        page = self._add_page(title)
-        paragraphs = story.split("\n\n")[1:]
-        for paragraph in paragraphs:
-            lines = self._wrap_text(paragraph, self.fonts["text"], self.textarea.width)
-            for line in lines:
-                self.cursor["x"] = 0
-                text = self.fonts["text"].render(line, True, TEXT_COLOR)
-                if self.cursor["y"] + self.fonts["text"].get_height() > page["buffer"].get_height():
-                    page = self._add_page()
-
-                self._display_surface(text, self.cursor["x"], self.cursor["y"], page["buffer"])
-                self.cursor["y"] += self.fonts["text"].size(line)[1]
-
-            if self.cursor["y"] > 0:
-                self.cursor["y"] += PARAGRAPH_SPACING
-
-        print(f"Loaded story at index {self.story} with {len(self.pages)} pages")
+            self._add_page(pages, "A Story")
+        print(f"Loaded story with {len(pages)} pages")
         self._set_status_color(NEOPIXEL_READING_COLOR)
-        self._busy = False
 
-    def _add_page(self, title=None):
+    def _add_page(self, pages, title=None):
         page = {"title": title, "text_position": 0}
         if title:
             page["text_position"] = self._title_text_height(title) + PARAGRAPH_SPACING
-        page["buffer"] = self._create_transparent_buffer(
-            (self.textarea.width, self.textarea.height - page["text_position"])
+        page["buffer"] = _new_alpha_buf(
+            self.textarea.width, self.textarea.height - page["text_position"]
         )
         self.cursor["y"] = 0
-        self.pages.append(page)
+        pages.append(page)
         return page
 
     def generate_new_story(self) -> bool:
@@ -882,12 +1182,13 @@ class Book:
         if not self._sleep_request:
             self.display_message("Please tell me the story you wish to read. \n\n Please Speak now!")
     
-        # Wait for the listener thread to finish on its own
-        while not self.listener.speech_waiting():
+        # Wait for the listener to finish on its own. stop_listening() sets
+        # the same event, so the timeout only bounds how often we look at
+        # _sleep_request while a transcription is still in flight.
+        while not self.listener.wait(timeout=0.5):
             if self._sleep_request:
                 self._busy = False
                 return False
-            time.sleep(0.05)
 
         if self._sleep_request:
             self._busy = False
@@ -899,14 +1200,7 @@ class Book:
             return False
 
         # Listener finished; grab the text (may be empty)
-        story_request = (self.listener.recognize() or "").strip()
-        if not story_request:
-            print("No response from user.")
-            self._busy = False
-            return False
-    
-        # Listener finished; grab the text (may be empty)
-        story_request = (self.listener.recognize() or "").strip()
+        story_request = self.listener.recognize().strip()
         if not story_request:
             print("No response from user.")
             self._busy = False
@@ -917,23 +1211,43 @@ class Book:
         story_prompt = self._make_story_prompt(story_request)
         self.display_loading()
     
-        response = self._sendchat(story_prompt)
-        if self._sleep_request:
-            self._busy = False
-            return False
+        # Lay the story out paragraph by paragraph while it streams in, and
+        # show the first page as soon as it is full.
+        pages = []
+        streamer = StoryStreamer(lambda block: self._layout_block(pages, block))
+        previous = None
+    
+        def on_chunk(chunk):
+            nonlocal previous
+            streamer.feed(chunk)
+            if previous is None and len(pages) > 1:
+                previous = (self.pages, self.story, self.page)
+                self.pages, self.story, self.page = pages, len(self.stories), 0
+                self.display_current_page()
+                self._busy = True
     
-        if not response:
+        response = self._sendchat(story_prompt, on_chunk)
+        if self._sleep_request or not response:
+            if previous is not None:
+                self.pages, self.story, self.page = previous
             self._busy = False
             return False
     
         print(response)
     
-        self.stories.append(response)
+        if response == OLLAMA_ERROR_STORY:
+            pages = self._layout_story(response)
+        else:
+            streamer.close()
+            self._finish_layout(pages)
+    
+        # The textarea is fixed once start() has run, so cached pages never
+        # need invalidating.
+        self.stories.append({"text": response, "pages": pages})
         self.story = len(self.stories) - 1
+        self.pages = pages
         self.page = 0
         self._busy = False
-    
-        self.load_story(response)
         return True
 
     def _sleep(self):
@@ -941,14 +1255,20 @@ class Book:
         self._sleep_request = True
         if self.listener.is_listening():
             self.listener.stop_listening()
-        while self._busy:
-            time.sleep(0.1)
+        self._idle.wait()
         self._sleep_request = False
 
-        if len(self._closing_times) == 0 or (time.monotonic() - self._closing_times[-1]) > QUIT_DEBOUNCE_DELAY:
-            self._closing_times.append(time.monotonic())
-
-        if len(self._closing_times) == QUIT_CLOSES and self._closing_times[-1] - self._closing_times[0] < QUIT_TIME_PERIOD:
+        # _close_ts is a fixed ring; _close_idx is the next slot to write,
+        # which is also the oldest entry once the ring is full.
+        now = time.monotonic()
+        if self._close_count == 0 or (now - self._close_ts[self._close_idx - 1]) > QUIT_DEBOUNCE_DELAY:
+            self._close_ts[self._close_idx] = now
+            self._close_idx = (self._close_idx + 1) % QUIT_CLOSES
+            self._close_count = min(self._close_count + 1, QUIT_CLOSES)
+
+        latest = self._close_ts[self._close_idx - 1]
+        oldest = self._close_ts[self._close_idx]
+        if self._close_count == QUIT_CLOSES and latest - oldest < QUIT_TIME_PERIOD:
             self._running = False
             return
 
@@ -964,9 +1284,19 @@ class Book:
         self._sleeping = False
 
     def _make_story_prompt(self, request):
-        return self._prompt.format(STORY_WORD_LENGTH=STORY_WORD_LENGTH, STORY_REQUEST=request)
+        return self._prompt.replace("{STORY_REQUEST}", request)
+
+    def _prefetch_model(self):
+        try:
+            print(f"Using Ollama model: {self.ollama.ensure_model()}")
+        except Exception as e:
+            print(f"Ollama model lookup failed; will retry on first story. ({e})")
+
+    def _sendchat(self, prompt, on_chunk=None):
+        if self._model_thread is not None:
+            self._model_thread.join(timeout=5)
+            self._model_thread = None
 
-    def _sendchat(self, prompt):
         response = ""
         print("Sending to Ollama")
         print("Prompt: ", prompt)
@@ -974,14 +1304,28 @@ class Book:
         try:
             for chunk in self.ollama.chat_stream(SYSTEM_ROLE, prompt):
                 response += chunk
+                if on_chunk is not None:
+                    on_chunk(chunk)
                 if self._sleep_request:
                     return None
         except Exception as e:
             print(f"Ollama error: {e}")
-            return "Title: Error\n\nI couldn't reach the storyteller's magic brain. Please try again."
+            return OLLAMA_ERROR_STORY
 
         return strip_fancy_quotes(response)
 
+    @property
+    def _busy(self):
+        return not self._idle.is_set()
+
+    @_busy.setter
+    def _busy(self, value):
+        # Backed by an Event so _sleep() can block on it instead of polling
+        if value:
+            self._idle.clear()
+        else:
+            self._idle.set()
+
     @property
     def running(self):
         return self._running
@@ -1006,7 +1350,21 @@ def parse_args():
     return parser.parse_args()
     
 
+def start_log_listener():
+    """Send log records through a queue so threads never block on stdout."""
+    log_queue = queue.SimpleQueue()
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(levelname)s %(name)s: %(message)s",
+        handlers=[QueueHandler(log_queue)],
+    )
+    log_listener = QueueListener(log_queue, logging.StreamHandler(sys.stdout))
+    log_listener.start()
+    return log_listener
+
+
 def main(args):
+    log_listener = start_log_listener()
     book = Book(args.rotation)
     try:
         book.start()
@@ -1022,6 +1380,7 @@ def main(args):
     finally:
         book.deinit()
         pygame.quit()
+        log_listener.stop()
 
 
 if __name__ == "__main__":
@@ -1,13 +1,16 @@
 from listener import Listener
+import logging
 import time
 
+logging.basicConfig(level=logging.DEBUG)
+
 listener = Listener(record_timeout=5)
 
 input("Press ENTER, then speak clearly... ")
 
 listener.listen()
 
-while listener.is_listening():
+while not listener.speech_waiting():
     time.sleep(0.1)
 
 print("RESULT:", listener.recognize())